@@ -0,0 +1,76 @@
+"""Shared chat model construction for the agents."""
+import functools
+from typing import Optional, Union
+
+from langchain_anthropic import ChatAnthropic
+from langchain_core.messages import BaseMessage
+from langchain_openai import ChatOpenAI
+
+from config import config
+
+
+def message_text(message: BaseMessage) -> str:
+    """Return the text content of a chat model response.
+
+    Chat models always return a BaseMessage, so no hasattr probing or
+    repr-building str() fallback is needed. Anthropic responses may carry a
+    list of content blocks; those are flattened to their text parts.
+
+    Args:
+        message: The chat model response message
+
+    Returns:
+        Text content of the message
+    """
+    content = message.content
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block.get("text", "") if isinstance(block, dict) else str(block)
+        for block in content
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def get_llm(
+    llm_provider: str = "anthropic",
+    model: Optional[str] = None,
+    temperature: Optional[float] = None,
+) -> Union[ChatAnthropic, ChatOpenAI]:
+    """Return a shared chat model for the given provider settings.
+
+    Chat models are stateless, so one instance per (provider, model,
+    temperature) is cached and reused across agents. That keeps a single
+    underlying HTTP connection pool per provider instead of paying a new
+    client construction and TLS handshake for every agent.
+
+    Args:
+        llm_provider: "anthropic" or "openai"
+        model: Model name (defaults to the configured/provider default)
+        temperature: Sampling temperature (defaults to the configured value)
+
+    Returns:
+        Shared chat model instance
+
+    Raises:
+        ValueError: If the provider's API key is not configured
+    """
+    if temperature is None:
+        temperature = config.llm.temperature
+
+    if llm_provider == "anthropic":
+        if not config.llm.anthropic_api_key:
+            raise ValueError("ANTHROPIC_API_KEY not set in .env file")
+        return ChatAnthropic(
+            model=model or config.llm.default_model,
+            api_key=config.llm.anthropic_api_key,
+            temperature=temperature,
+        )
+
+    if not config.llm.openai_api_key:
+        raise ValueError("OPENAI_API_KEY not set in .env file")
+    return ChatOpenAI(
+        model=model or "gpt-4-turbo-preview",
+        api_key=config.llm.openai_api_key,
+        temperature=temperature,
+    )
@@ -1,37 +1,31 @@
 """Persona agent for character-based interactions."""
-from typing import List, Optional, Dict, Any
-
-from langchain.memory import ConversationBufferMemory
-from langchain.chains import ConversationChain
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from datetime import datetime
+from typing import AsyncIterator, Iterator, List, Optional, Dict, Any, Tuple
+
+from langchain.memory import ConversationBufferWindowMemory
 from langchain.prompts import PromptTemplate
-from langchain_anthropic import ChatAnthropic
-from langchain_openai import ChatOpenAI
+from langchain_core.messages import HumanMessage, SystemMessage
 from pydantic import BaseModel
 
+from agents.llm import get_llm, message_text
 from config import config
-from storage.vector_store import VectorKnowledgeBase
-
+from storage.vector_store import get_shared_knowledge_base
 
-PERSONA_PROMPT = """You are {character_name}, a character with the following background and personality:
 
-{character_knowledge}
+PERSONA_SYSTEM_PROMPT = """You are {character_name}, a character with the following background and personality.
 
 Character Guidelines:
 - Stay in character at all times
 - Use speech patterns and mannerisms consistent with your personality
 - Reference your background knowledge naturally in conversations
 - React to situations based on your established personality traits
-- Maintain consistency with your character's relationships and experiences
-
-Current conversation:
-{history}
-
-{character_name}: """
+- Maintain consistency with your character's relationships and experiences"""
 
-CONTENT_GENERATION_PROMPT = """You are {character_name}.
-{character_knowledge}
-
-Your task is to compose a {content_type} written by you{recipient_context}.
+COMPOSE_TASK_PROMPT = """Your task is to compose a {content_type} written by you{recipient_context}.
 
 Topic/Context: {topic}
 Tone: {tone}
@@ -44,6 +38,12 @@ Instructions:
 
 Content:"""
 
+# Maximum number of LLM responses kept in the per-agent LRU cache
+RESPONSE_CACHE_SIZE = 512
+
+# Number of conversation turns re-sent to the LLM; older turns stay on disk
+CONVERSATION_WINDOW = 20
+
 
 class CharacterPersona(BaseModel):
     """Character persona configuration."""
@@ -63,6 +63,7 @@ class PersonaAgent:
         character_name: str,
         llm_provider: str = "anthropic",
         persona_config: Optional[CharacterPersona] = None,
+        use_cache: bool = True,
     ):
         """Initialize the persona agent.
 
@@ -70,57 +71,78 @@ class PersonaAgent:
             character_name: Name of the character
             llm_provider: "anthropic" or "openai"
             persona_config: Optional custom persona configuration
+            use_cache: Whether to cache identical LLM calls in memory
         """
         self.character_name = character_name
+        self.llm_provider = llm_provider
         self.persona_config = persona_config or CharacterPersona(name=character_name)
 
-        # Initialize LLM
-        if llm_provider == "anthropic":
-            if not config.llm.anthropic_api_key:
-                raise ValueError("ANTHROPIC_API_KEY not set in .env file")
-            self.llm = ChatAnthropic(
-                model=config.llm.default_model,
-                api_key=config.llm.anthropic_api_key,
-                temperature=config.llm.temperature,
-            )
-        else:
-            if not config.llm.openai_api_key:
-                raise ValueError("OPENAI_API_KEY not set in .env file")
-            self.llm = ChatOpenAI(
-                model="gpt-4-turbo-preview",
-                api_key=config.llm.openai_api_key,
-                temperature=config.llm.temperature,
-            )
+        # Initialize LLM (shared across agents)
+        self.llm = get_llm(llm_provider)
 
-        # Initialize knowledge base
-        self.knowledge_base = VectorKnowledgeBase()
+        # Initialize knowledge base (shared per process)
+        self.knowledge_base = get_shared_knowledge_base()
 
         # Load character knowledge
         self.character_knowledge = self._load_character_knowledge()
 
-        # Initialize memory
-        self.memory = ConversationBufferMemory(
-            memory_key="history",
-            return_messages=False,
-        )
+        # Build the static persona prefix once (cacheable for Anthropic)
+        self._persona_system_message = self._build_persona_system_message()
 
-        # Create conversation chain
-        prompt = PromptTemplate(
-            input_variables=["history", "input"],
-            template=PERSONA_PROMPT,
-            partial_variables={
-                "character_name": self.character_name,
-                "character_knowledge": self.character_knowledge,
-            },
+        # Compile the compose task template once instead of per call
+        self._compose_prompt = PromptTemplate(
+            input_variables=["content_type", "topic", "tone", "recipient_context"],
+            template=COMPOSE_TASK_PROMPT,
         )
 
-        self.conversation = ConversationChain(
-            llm=self.llm,
-            memory=self.memory,
-            prompt=prompt,
-            verbose=True,
+        # In-memory LRU cache for identical LLM calls
+        self.use_cache = use_cache
+        self._response_cache: "OrderedDict[Tuple, str]" = OrderedDict()
+        self._knowledge_hash = hashlib.sha256(
+            self.character_knowledge.encode("utf-8")
+        ).hexdigest()[:16]
+
+        # Initialize memory, bounded so per-turn token cost stays O(1)
+        self.memory = ConversationBufferWindowMemory(
+            memory_key="history",
+            return_messages=True,
+            k=CONVERSATION_WINDOW,
         )
 
+        # Full history is appended turn by turn to a per-character JSONL file
+        self._history_path = config.conversations_dir / f"{self._safe_name()}.jsonl"
+
+    def _build_persona_system_message(self) -> SystemMessage:
+        """Build the persona system prefix sent ahead of direct LLM calls.
+
+        For Anthropic, the static persona instructions and the (potentially
+        large) character knowledge are emitted as separate content blocks
+        marked with cache_control, so the provider's prompt cache reuses the
+        prefix across calls instead of re-billing the prefill each time.
+
+        Returns:
+            SystemMessage with the persona prefix
+        """
+        persona_text = PERSONA_SYSTEM_PROMPT.format(character_name=self.character_name)
+
+        if self.llm_provider == "anthropic":
+            return SystemMessage(
+                content=[
+                    {
+                        "type": "text",
+                        "text": persona_text,
+                        "cache_control": {"type": "ephemeral"},
+                    },
+                    {
+                        "type": "text",
+                        "text": self.character_knowledge,
+                        "cache_control": {"type": "ephemeral"},
+                    },
+                ]
+            )
+
+        return SystemMessage(content=f"{persona_text}\n\n{self.character_knowledge}")
+
     def _load_character_knowledge(self) -> str:
         """Load character knowledge from the vector knowledge base.
 
@@ -131,7 +153,7 @@ class PersonaAgent:
         knowledge = self.knowledge_base.get_character_knowledge(self.character_name)
 
         # If no knowledge found, use persona config
-        if "No knowledge found" in knowledge:
+        if knowledge is None:
             knowledge_parts = [f"Character: {self.character_name}"]
 
             if self.persona_config.background_summary:
@@ -151,6 +173,64 @@ class PersonaAgent:
 
         return knowledge
 
+    def _safe_name(self) -> str:
+        """Return the character name sanitized for use as a filename."""
+        name = self.character_name
+        for char in '<>:"/\\|?*':
+            name = name.replace(char, "_")
+        return name
+
+    def _append_history(self, user_input: str, response: str) -> None:
+        """Append one conversation turn to the on-disk history.
+
+        Turns are written incrementally as JSON lines, so nothing is lost if
+        the process dies mid-session and no full rewrite happens per turn.
+        """
+        record = {
+            "timestamp": datetime.now().isoformat(),
+            "user": user_input,
+            "assistant": response,
+        }
+        with self._history_path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def _cache_get(self, key: Tuple) -> Optional[str]:
+        """Look up a cached response, refreshing its LRU position on a hit."""
+        if not self.use_cache:
+            return None
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            self._response_cache.move_to_end(key)
+        return cached
+
+    def _cache_put(self, key: Tuple, response: str) -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        if not self.use_cache:
+            return
+        self._response_cache[key] = response
+        if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+
+    def _chat_cache_key(self, user_input: str) -> Tuple:
+        """Build the cache key for a chat turn.
+
+        The current conversation history is part of the key, so a repeated
+        message only hits the cache when the surrounding context is identical.
+        """
+        history = self.memory.load_memory_variables({}).get("history", [])
+        history_hash = hashlib.sha256(str(history).encode("utf-8")).hexdigest()[:16]
+        return ("chat", self._knowledge_hash, history_hash, user_input)
+
+    def _build_chat_messages(self, user_input: str) -> List[Any]:
+        """Build the message list for a chat turn.
+
+        The cached persona prefix comes first, then the windowed history as
+        real messages (no string flattening, so the prefix stays cacheable),
+        then the new user turn.
+        """
+        history = self.memory.load_memory_variables({}).get("history", [])
+        return [self._persona_system_message, *history, HumanMessage(content=user_input)]
+
     def chat(self, user_input: str) -> str:
         """Have a conversation with the character.
 
@@ -160,7 +240,43 @@ class PersonaAgent:
         Returns:
             Character's response
         """
-        response = self.conversation.predict(input=user_input)
+        key = self._chat_cache_key(user_input)
+        cached = self._cache_get(key)
+        if cached is not None:
+            # Record the turn so the conversation history stays consistent
+            self.memory.save_context({"input": user_input}, {"output": cached})
+            self._append_history(user_input, cached)
+            return cached
+
+        response = message_text(self.llm.invoke(self._build_chat_messages(user_input)))
+        self.memory.save_context({"input": user_input}, {"output": response})
+        self._cache_put(key, response)
+        self._append_history(user_input, response)
+        return response
+
+    async def achat(self, user_input: str) -> str:
+        """Async variant of :meth:`chat`.
+
+        Args:
+            user_input: User's message
+
+        Returns:
+            Character's response
+        """
+        key = self._chat_cache_key(user_input)
+        cached = self._cache_get(key)
+        if cached is not None:
+            # Record the turn so the conversation history stays consistent
+            self.memory.save_context({"input": user_input}, {"output": cached})
+            self._append_history(user_input, cached)
+            return cached
+
+        response = message_text(
+            await self.llm.ainvoke(self._build_chat_messages(user_input))
+        )
+        self.memory.save_context({"input": user_input}, {"output": response})
+        self._cache_put(key, response)
+        self._append_history(user_input, response)
         return response
 
     def compose(
@@ -181,27 +297,144 @@ class PersonaAgent:
         Returns:
             Generated content
         """
+        key = ("compose", self._knowledge_hash, content_type, topic, recipient, tone)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        messages = self._build_compose_messages(content_type, topic, recipient, tone)
+        content = message_text(self.llm.invoke(messages))
+        self._cache_put(key, content)
+        return content
+
+    async def acompose(
+        self,
+        content_type: str,
+        topic: str,
+        recipient: Optional[str] = None,
+        tone: Optional[str] = "characteristic",
+    ) -> str:
+        """Async variant of :meth:`compose`.
+
+        Args:
+            content_type: Type of content (letter, sms, tweet, etc.)
+            topic: Topic or context for the content
+            recipient: Optional recipient name
+            tone: Optional tone instruction
+
+        Returns:
+            Generated content
+        """
+        key = ("compose", self._knowledge_hash, content_type, topic, recipient, tone)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        messages = self._build_compose_messages(content_type, topic, recipient, tone)
+        content = message_text(await self.llm.ainvoke(messages))
+        self._cache_put(key, content)
+        return content
+
+    def stream_compose(
+        self,
+        content_type: str,
+        topic: str,
+        recipient: Optional[str] = None,
+        tone: Optional[str] = "characteristic",
+    ) -> Iterator[str]:
+        """Stream composed content chunk by chunk.
+
+        The first token arrives as soon as the provider produces it, instead
+        of blocking until the full response is materialized. A cache hit
+        yields the whole response at once; a miss is cached after streaming
+        completes.
+
+        Args:
+            content_type: Type of content (letter, sms, tweet, etc.)
+            topic: Topic or context for the content
+            recipient: Optional recipient name
+            tone: Optional tone instruction
+
+        Yields:
+            Chunks of generated content
+        """
+        key = ("compose", self._knowledge_hash, content_type, topic, recipient, tone)
+        cached = self._cache_get(key)
+        if cached is not None:
+            yield cached
+            return
+
+        messages = self._build_compose_messages(content_type, topic, recipient, tone)
+        parts = []
+        for chunk in self.llm.stream(messages):
+            if chunk.content:
+                parts.append(chunk.content)
+                yield chunk.content
+        self._cache_put(key, "".join(parts))
+
+    async def astream_compose(
+        self,
+        content_type: str,
+        topic: str,
+        recipient: Optional[str] = None,
+        tone: Optional[str] = "characteristic",
+    ) -> AsyncIterator[str]:
+        """Async variant of :meth:`stream_compose`.
+
+        Args:
+            content_type: Type of content (letter, sms, tweet, etc.)
+            topic: Topic or context for the content
+            recipient: Optional recipient name
+            tone: Optional tone instruction
+
+        Yields:
+            Chunks of generated content
+        """
+        key = ("compose", self._knowledge_hash, content_type, topic, recipient, tone)
+        cached = self._cache_get(key)
+        if cached is not None:
+            yield cached
+            return
+
+        messages = self._build_compose_messages(content_type, topic, recipient, tone)
+        parts = []
+        async for chunk in self.llm.astream(messages):
+            if chunk.content:
+                parts.append(chunk.content)
+                yield chunk.content
+        self._cache_put(key, "".join(parts))
+
+    def _build_compose_messages(
+        self,
+        content_type: str,
+        topic: str,
+        recipient: Optional[str],
+        tone: Optional[str],
+    ) -> List[Any]:
+        """Build the message list for a compose call.
+
+        The dynamic task (content type, topic, tone) goes into the user turn
+        so it stays out of the cached persona prefix.
+
+        Args:
+            content_type: Type of content (letter, sms, tweet, etc.)
+            topic: Topic or context for the content
+            recipient: Optional recipient name
+            tone: Optional tone instruction
+
+        Returns:
+            List of messages for the LLM call
+        """
         recipient_context = f" addressed to {recipient}" if recipient else ""
-        
-        prompt = PromptTemplate(
-            input_variables=["content_type", "topic", "tone", "recipient_context"],
-            template=CONTENT_GENERATION_PROMPT,
-            partial_variables={
-                "character_name": self.character_name,
-                "character_knowledge": self.character_knowledge,
-            },
+
+        task = self._compose_prompt.format(
+            content_type=content_type,
+            topic=topic,
+            recipient_context=recipient_context,
+            tone=tone,
         )
-        
-        chain = prompt | self.llm
-        
-        response = chain.invoke({
-            "content_type": content_type,
-            "topic": topic,
-            "recipient_context": recipient_context,
-            "tone": tone,
-        })
-        
-        return response.content if hasattr(response, "content") else str(response)
+
+        return [self._persona_system_message, HumanMessage(content=task)]
 
     def reset_conversation(self) -> None:
         """Reset the conversation memory."""
@@ -223,6 +456,7 @@ def create_persona_agent(
     personality_traits: Optional[List[str]] = None,
     speech_style: Optional[str] = None,
     background: Optional[str] = None,
+    use_cache: bool = True,
 ) -> PersonaAgent:
     """Convenience function to create a persona agent.
 
@@ -231,6 +465,7 @@ def create_persona_agent(
         personality_traits: List of personality traits
         speech_style: Description of speech style
         background: Background summary
+        use_cache: Whether to cache identical LLM calls in memory
 
     Returns:
         PersonaAgent instance
@@ -242,4 +477,8 @@ def create_persona_agent(
         background_summary=background,
     )
 
-    return PersonaAgent(character_name=character_name, persona_config=persona_config)
\ No newline at end of file
+    return PersonaAgent(
+        character_name=character_name,
+        persona_config=persona_config,
+        use_cache=use_cache,
+    )
\ No newline at end of file
@@ -1,15 +1,16 @@
 """Research agent for gathering information about characters and works."""
-from typing import List, Optional
+import asyncio
+import re
+from typing import List, Optional, Tuple, Union
 from datetime import datetime
 
 from langchain.agents import AgentExecutor, create_react_agent
 from langchain.prompts import PromptTemplate
 from langchain.tools import Tool
-from langchain_anthropic import ChatAnthropic
-from langchain_openai import ChatOpenAI
+from pydantic import BaseModel
 
-from config import config
-from storage.vector_store import VectorKnowledgeBase, CharacterKnowledge
+from agents.llm import get_llm
+from storage.vector_store import CharacterKnowledge, get_shared_knowledge_base
 from storage.markdown_exporter import (
     MarkdownExporter,
     ResearchReport,
@@ -69,6 +70,16 @@ Current research subject: {input}
 {agent_scratchpad}
 """
 
+# Compiled once; matches URLs anywhere in the findings text
+_URL_RE = re.compile(r"https?://[^\s)>\"']+")
+
+
+class StructuredFindings(BaseModel):
+    """Schema the structuring LLM call must return."""
+
+    summary: str
+    sections: List[ResearchSection]
+
 
 class ResearchAgent:
     """Agent for researching characters and entertainment content."""
@@ -79,29 +90,20 @@ class ResearchAgent:
         Args:
             llm_provider: "anthropic" or "openai"
         """
-        # Initialize LLM
-        if llm_provider == "anthropic":
-            if not config.llm.anthropic_api_key:
-                raise ValueError("ANTHROPIC_API_KEY not set in .env file")
-            self.llm = ChatAnthropic(
-                model=config.llm.default_model,
-                api_key=config.llm.anthropic_api_key,
-                temperature=config.llm.temperature,
-            )
-        else:
-            if not config.llm.openai_api_key:
-                raise ValueError("OPENAI_API_KEY not set in .env file")
-            self.llm = ChatOpenAI(
-                model="gpt-4-turbo-preview",
-                api_key=config.llm.openai_api_key,
-                temperature=config.llm.temperature,
-            )
+        # Initialize LLM (shared across agents)
+        self.llm = get_llm(llm_provider)
+
+        # Provider-native structured output for report structuring
+        self._structuring_llm = self.llm.with_structured_output(StructuredFindings)
 
         # Initialize tools
         self.tools = self._create_tools()
 
-        # Initialize vector knowledge base
-        self.knowledge_base = VectorKnowledgeBase()
+        # Initialize vector knowledge base (shared per process)
+        self.knowledge_base = get_shared_knowledge_base()
+
+        # Findings buffered for a batched knowledge-base write
+        self._pending_knowledge: List[CharacterKnowledge] = []
 
         # Initialize markdown exporter
         self.exporter = MarkdownExporter()
@@ -190,24 +192,101 @@ class ResearchAgent:
 
         return report
 
-    def _create_structured_report(
+    async def aresearch(
         self,
         subject: str,
-        subject_type: str,
-        findings: str,
+        subject_type: str = "character",
+        save_to_kb: bool = True,
+        defer_kb: bool = False,
     ) -> ResearchReport:
-        """Create a structured report from raw findings.
+        """Async variant of :meth:`research`.
+
+        Args:
+            subject: The subject to research (character name, work title, etc.)
+            subject_type: Type of subject ("character", "work", etc.)
+            save_to_kb: Whether to save findings to the knowledge base
+            defer_kb: Buffer KB writes for a later flush_knowledge() call
+
+        Returns:
+            ResearchReport with all findings
+        """
+        print(f"\n🔍 Starting research on: {subject} ({subject_type})")
+        print("=" * 60)
+
+        # Run the agent
+        result = await self.agent_executor.ainvoke({"input": subject})
+
+        # Extract the findings
+        findings = result.get("output", "No findings available")
+
+        print("\n✅ Research completed!")
+        print("=" * 60)
+
+        # Create structured report using LLM
+        report = await self._acreate_structured_report(subject, subject_type, findings)
+
+        # Save to knowledge base
+        if save_to_kb:
+            self._save_to_knowledge_base(subject, findings, defer=defer_kb)
+
+        # Export to markdown
+        filepath = self.exporter.export(report)
+        print(f"\n📄 Report saved to: {filepath}")
+
+        return report
+
+    async def research_batch(
+        self,
+        subjects: List[Tuple[str, str]],
+        concurrency: int = 4,
+        save_to_kb: bool = True,
+    ) -> List[Union[ResearchReport, Exception]]:
+        """Research multiple subjects concurrently.
+
+        Fans the subjects out with asyncio.gather under a semaphore so LLM and
+        network latency overlap while provider rate limits are respected.
+
+        Args:
+            subjects: List of (subject, subject_type) pairs
+            concurrency: Maximum number of subjects researched at once
+            save_to_kb: Whether to save findings to the knowledge base
+
+        Returns:
+            List of ResearchReport objects (or the exception raised for a
+            subject), in the same order as the input
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(subject: str, subject_type: str) -> ResearchReport:
+            async with semaphore:
+                return await self.aresearch(
+                    subject=subject,
+                    subject_type=subject_type,
+                    save_to_kb=save_to_kb,
+                    defer_kb=True,
+                )
+
+        results = await asyncio.gather(
+            *[_one(subject, subject_type) for subject, subject_type in subjects],
+            return_exceptions=True,
+        )
+
+        # One batched embed + persist for the whole batch
+        self.flush_knowledge()
+
+        return results
+
+    def _build_structuring_prompt(self, subject: str, findings: str) -> str:
+        """Build the prompt used to structure raw findings.
 
         Args:
             subject: The research subject
-            subject_type: Type of subject
             findings: Raw research findings
 
         Returns:
-            Structured ResearchReport
+            Prompt string for the structuring LLM call
         """
-        # Use LLM to structure the findings
-        structuring_prompt = f"""Given the following research findings about {subject}, create a structured summary.
+        return f"""Given the following research findings about {subject}, create a structured summary.
 
 Research findings:
 {findings}
@@ -215,24 +294,69 @@ Research findings:
 Please provide:
 1. A brief summary (2-3 sentences)
 2. Key sections with detailed information
-
-Format your response as JSON with this structure:
-{{
-    "summary": "brief summary here",
-    "sections": [
-        {{"title": "Section Title", "content": "Section content"}},
-        ...
-    ]
-}}
 """
 
+    def _create_structured_report(
+        self,
+        subject: str,
+        subject_type: str,
+        findings: str,
+    ) -> ResearchReport:
+        """Create a structured report from raw findings.
+
+        Args:
+            subject: The research subject
+            subject_type: Type of subject
+            findings: Raw research findings
+
+        Returns:
+            Structured ResearchReport
+        """
+        # Use LLM to structure the findings
+        structuring_prompt = self._build_structuring_prompt(subject, findings)
+
         try:
-            response = self.llm.invoke(structuring_prompt)
-            # Parse the response (simplified - in production, use proper JSON parsing)
-            summary = findings[:500]  # Fallback
+            parsed = self._structuring_llm.invoke(structuring_prompt)
+            summary = parsed.summary
+            sections = parsed.sections
+        except Exception as e:
+            print(f"Error structuring report: {e}")
+            summary = f"Research findings for {subject}"
             sections = [
                 ResearchSection(title="Research Findings", content=findings)
             ]
+
+        return ResearchReport(
+            subject=subject,
+            subject_type=subject_type,
+            summary=summary,
+            sections=sections,
+            sources=self._extract_sources(findings),
+            created_at=datetime.now(),
+        )
+
+    async def _acreate_structured_report(
+        self,
+        subject: str,
+        subject_type: str,
+        findings: str,
+    ) -> ResearchReport:
+        """Async variant of :meth:`_create_structured_report`.
+
+        Args:
+            subject: The research subject
+            subject_type: Type of subject
+            findings: Raw research findings
+
+        Returns:
+            Structured ResearchReport
+        """
+        structuring_prompt = self._build_structuring_prompt(subject, findings)
+
+        try:
+            parsed = await self._structuring_llm.ainvoke(structuring_prompt)
+            summary = parsed.summary
+            sections = parsed.sections
         except Exception as e:
             print(f"Error structuring report: {e}")
             summary = f"Research findings for {subject}"
@@ -249,12 +373,19 @@ Format your response as JSON with this structure:
             created_at=datetime.now(),
         )
 
-    def _save_to_knowledge_base(self, subject: str, findings: str) -> None:
+    def _save_to_knowledge_base(
+        self,
+        subject: str,
+        findings: str,
+        defer: bool = False,
+    ) -> None:
         """Save research findings to the vector knowledge base.
 
         Args:
             subject: The research subject
             findings: Research findings to save
+            defer: Buffer the entry for a later flush_knowledge() call
+                instead of embedding and persisting immediately
         """
         knowledge = CharacterKnowledge(
             character_name=subject,
@@ -263,10 +394,28 @@ Format your response as JSON with this structure:
             metadata={"timestamp": datetime.now().isoformat()},
         )
 
+        if defer:
+            self._pending_knowledge.append(knowledge)
+            return
+
         self.knowledge_base.add_knowledge(knowledge)
         self.knowledge_base.persist()
         print(f"💾 Saved to knowledge base: {subject}")
 
+    def flush_knowledge(self) -> None:
+        """Write all buffered findings to the knowledge base in one batch.
+
+        A single batched add amortizes embedding and persistence cost across
+        all pending entries instead of paying it once per subject.
+        """
+        if not self._pending_knowledge:
+            return
+
+        self.knowledge_base.add_knowledge_batch(self._pending_knowledge)
+        self.knowledge_base.persist()
+        print(f"💾 Saved {len(self._pending_knowledge)} entries to knowledge base")
+        self._pending_knowledge = []
+
     def _extract_sources(self, findings: str) -> List[str]:
         """Extract source URLs from findings.
 
@@ -276,15 +425,4 @@ Format your response as JSON with this structure:
         Returns:
             List of source URLs
         """
-        sources = []
-        # Simple URL extraction (could be improved with regex)
-        lines = findings.split("\n")
-        for line in lines:
-            if "http://" in line or "https://" in line:
-                # Extract URL (simplified)
-                words = line.split()
-                for word in words:
-                    if word.startswith("http"):
-                        sources.append(word.rstrip(".,;)"))
-
-        return list(set(sources))  # Remove duplicates
+        return list({url.rstrip(".,;") for url in _URL_RE.findall(findings)})
@@ -9,41 +9,54 @@ from pydantic import BaseModel, Field
 # Load environment variables
 load_dotenv()
 
+# Snapshot the environment once at import so repeated Config construction
+# doesn't re-read and re-parse the same variables
+_ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
+_OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+_DEFAULT_MODEL = os.getenv("DEFAULT_MODEL", "claude-3-5-sonnet-20241022")
+_TEMPERATURE = float(os.getenv("TEMPERATURE", "0.7"))
+_MAX_TOKENS = int(os.getenv("MAX_TOKENS", "4096"))
+_GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
+_GOOGLE_CSE_ID = os.getenv("GOOGLE_CSE_ID")
+_TWITTER_BEARER_TOKEN = os.getenv("TWITTER_BEARER_TOKEN")
+_MAX_SEARCH_RESULTS = int(os.getenv("MAX_SEARCH_RESULTS", "10"))
+_SCRAPING_DELAY = float(os.getenv("SCRAPING_DELAY", "1.0"))
+_USER_AGENT = os.getenv("USER_AGENT", "Mozilla/5.0 (compatible; ResearchAgent/1.0)")
+_CHROMA_PERSIST_DIR = Path(os.getenv("CHROMA_PERSIST_DIR", "./data/chroma"))
+_COLLECTION_NAME = os.getenv("COLLECTION_NAME", "character_knowledge")
+_EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "torch")
+
+# Directory creation runs once per process, not on every Config()
+_DIRS_INITIALIZED = False
+
 
 class LLMConfig(BaseModel):
     """LLM configuration."""
 
-    anthropic_api_key: Optional[str] = Field(default_factory=lambda: os.getenv("ANTHROPIC_API_KEY"))
-    openai_api_key: Optional[str] = Field(default_factory=lambda: os.getenv("OPENAI_API_KEY"))
-    default_model: str = Field(default_factory=lambda: os.getenv("DEFAULT_MODEL", "claude-3-5-sonnet-20241022"))
-    temperature: float = Field(default_factory=lambda: float(os.getenv("TEMPERATURE", "0.7")))
-    max_tokens: int = Field(default_factory=lambda: int(os.getenv("MAX_TOKENS", "4096")))
+    anthropic_api_key: Optional[str] = _ANTHROPIC_API_KEY
+    openai_api_key: Optional[str] = _OPENAI_API_KEY
+    default_model: str = _DEFAULT_MODEL
+    temperature: float = _TEMPERATURE
+    max_tokens: int = _MAX_TOKENS
 
 
 class SearchConfig(BaseModel):
     """Search and scraping configuration."""
 
-    google_api_key: Optional[str] = Field(default_factory=lambda: os.getenv("GOOGLE_API_KEY"))
-    google_cse_id: Optional[str] = Field(default_factory=lambda: os.getenv("GOOGLE_CSE_ID"))
-    twitter_bearer_token: Optional[str] = Field(default_factory=lambda: os.getenv("TWITTER_BEARER_TOKEN"))
-    max_search_results: int = Field(default_factory=lambda: int(os.getenv("MAX_SEARCH_RESULTS", "10")))
-    scraping_delay: float = Field(default_factory=lambda: float(os.getenv("SCRAPING_DELAY", "1.0")))
-    user_agent: str = Field(
-        default_factory=lambda: os.getenv(
-            "USER_AGENT", "Mozilla/5.0 (compatible; ResearchAgent/1.0)"
-        )
-    )
+    google_api_key: Optional[str] = _GOOGLE_API_KEY
+    google_cse_id: Optional[str] = _GOOGLE_CSE_ID
+    twitter_bearer_token: Optional[str] = _TWITTER_BEARER_TOKEN
+    max_search_results: int = _MAX_SEARCH_RESULTS
+    scraping_delay: float = _SCRAPING_DELAY
+    user_agent: str = _USER_AGENT
 
 
 class VectorStoreConfig(BaseModel):
     """Vector store configuration."""
 
-    chroma_persist_dir: Path = Field(
-        default_factory=lambda: Path(os.getenv("CHROMA_PERSIST_DIR", "./data/chroma"))
-    )
-    collection_name: str = Field(
-        default_factory=lambda: os.getenv("COLLECTION_NAME", "character_knowledge")
-    )
+    chroma_persist_dir: Path = _CHROMA_PERSIST_DIR
+    collection_name: str = _COLLECTION_NAME
+    embedding_backend: str = _EMBEDDING_BACKEND  # "torch" or "onnx"
 
 
 class Config(BaseModel):
@@ -53,12 +66,19 @@ class Config(BaseModel):
     search: SearchConfig = Field(default_factory=SearchConfig)
     vector_store: VectorStoreConfig = Field(default_factory=VectorStoreConfig)
     outputs_dir: Path = Path("./outputs")
+    conversations_dir: Path = Path("./data/conversations")
+    cache_dir: Path = Path("./data/cache")
 
     def __init__(self, **data):
         super().__init__(**data)
-        # Create necessary directories
-        self.vector_store.chroma_persist_dir.mkdir(parents=True, exist_ok=True)
-        self.outputs_dir.mkdir(parents=True, exist_ok=True)
+        # Create necessary directories (once per process)
+        global _DIRS_INITIALIZED
+        if not _DIRS_INITIALIZED:
+            self.vector_store.chroma_persist_dir.mkdir(parents=True, exist_ok=True)
+            self.outputs_dir.mkdir(parents=True, exist_ok=True)
+            self.conversations_dir.mkdir(parents=True, exist_ok=True)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            _DIRS_INITIALIZED = True
 
 
 # Global config instance
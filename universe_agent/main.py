@@ -1,16 +1,18 @@
 #!/usr/bin/env python3
 """Main CLI entry point for the research agent."""
+import asyncio
+import threading
 from pathlib import Path
 from typing import Optional
 
 import typer
 from rich.console import Console
+from rich.live import Live
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from agents.researcher import ResearchAgent
-from agents.persona import create_persona_agent
-from storage.vector_store import VectorKnowledgeBase
+# Agent and storage modules pull in LangChain, provider SDKs and chromadb;
+# they are imported inside each command so lightweight commands stay fast.
 
 app = typer.Typer(
     name="research",
@@ -18,6 +20,36 @@ app = typer.Typer(
 )
 console = Console()
 
+# Commands that hit the knowledge base and benefit from a warm embedding model
+_KB_COMMANDS = {"research", "research-batch", "compose", "kb-search", "kb-info", "kb-reindex"}
+
+
+def _preload_knowledge_base() -> None:
+    """Warm the shared knowledge base in the background.
+
+    Loads the embedding model and primes the knowledge of characters with a
+    persona file, so the first real query doesn't pay the model-load cost.
+    Best-effort: real errors surface on first use.
+    """
+    try:
+        from storage.vector_store import get_shared_knowledge_base
+
+        kb = get_shared_knowledge_base()
+
+        personas_dir = Path(__file__).parent / "personas"
+        if personas_dir.is_dir():
+            for persona_file in personas_dir.glob("*-persona.md"):
+                kb.get_character_knowledge(persona_file.stem.removesuffix("-persona"))
+    except Exception:
+        pass
+
+
+@app.callback()
+def startup(ctx: typer.Context):
+    """Start background warm-up for knowledge-base commands."""
+    if ctx.invoked_subcommand in _KB_COMMANDS:
+        threading.Thread(target=_preload_knowledge_base, daemon=True).start()
+
 
 @app.command()
 def research(
@@ -41,6 +73,8 @@ def research(
     ),
 ):
     """Research a character or work and generate a report."""
+    from agents.researcher import ResearchAgent
+
     console.print(
         Panel.fit(
             f"[bold cyan]Research Agent[/bold cyan]\n"
@@ -70,6 +104,90 @@ def research(
         raise typer.Exit(1)
 
 
+@app.command()
+def research_batch(
+    subjects_file: Path = typer.Argument(
+        ...,
+        help="File with one subject per line, optionally 'subject,type'",
+    ),
+    concurrency: int = typer.Option(
+        4,
+        "--concurrency",
+        "-c",
+        help="Maximum number of subjects researched at once",
+    ),
+    llm: str = typer.Option(
+        "anthropic",
+        "--llm",
+        "-l",
+        help="LLM provider: anthropic or openai",
+    ),
+    no_save: bool = typer.Option(
+        False,
+        "--no-save",
+        help="Don't save findings to knowledge base",
+    ),
+):
+    """Research multiple subjects concurrently from a file."""
+    from agents.researcher import ResearchAgent
+
+    if not subjects_file.exists():
+        console.print(f"[bold red]Error:[/bold red] File not found: {subjects_file}")
+        raise typer.Exit(1)
+
+    subjects = []
+    for line in subjects_file.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        subject, _, subject_type = line.partition(",")
+        subjects.append((subject.strip(), subject_type.strip() or "character"))
+
+    if not subjects:
+        console.print("[yellow]No subjects found in file.[/yellow]")
+        return
+
+    console.print(
+        Panel.fit(
+            f"[bold cyan]Batch Research[/bold cyan]\n"
+            f"Subjects: [yellow]{len(subjects)}[/yellow]\n"
+            f"Concurrency: [green]{concurrency}[/green]",
+            border_style="cyan",
+        )
+    )
+
+    try:
+        # Initialize agent
+        with console.status("[bold green]Initializing research agent..."):
+            agent = ResearchAgent(llm_provider=llm)
+
+        # Conduct research concurrently
+        results = asyncio.run(
+            agent.research_batch(
+                subjects=subjects,
+                concurrency=concurrency,
+                save_to_kb=not no_save,
+            )
+        )
+
+        failures = 0
+        for (subject, _), result in zip(subjects, results):
+            if isinstance(result, Exception):
+                failures += 1
+                console.print(f"[bold red]✗[/bold red] {subject}: {result}")
+            else:
+                console.print(f"[bold green]✓[/bold green] {subject}")
+
+        if failures:
+            console.print(f"\n[yellow]{failures} of {len(subjects)} subjects failed.[/yellow]")
+        else:
+            console.print("\n[bold green]✓[/bold green] Batch research completed successfully!")
+
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        raise typer.Exit(1)
+
+
 @app.command()
 def compose(
     character: str = typer.Argument(..., help="Character name"),
@@ -83,8 +201,15 @@ def compose(
         "-l",
         help="LLM provider: anthropic or openai",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Don't reuse cached responses for identical requests",
+    ),
 ):
     """Generate content written by a character persona."""
+    from agents.persona import create_persona_agent
+
     console.print(
         Panel.fit(
             f"[bold magenta]Character Composer[/bold magenta]\n"
@@ -98,19 +223,21 @@ def compose(
     try:
         # Initialize persona agent
         with console.status(f"[bold green]Loading {character}'s persona..."):
-            agent = create_persona_agent(character_name=character)
+            agent = create_persona_agent(character_name=character, use_cache=not no_cache)
 
-        # Generate content
-        with console.status("[dim]Composing...[/dim]"):
-            content = agent.compose(
+        # Generate content, rendering chunks as they stream in
+        console.print("\n[bold green]✓[/bold green] Generated Content:\n")
+        content = ""
+        title = f"{character}'s {content_type}"
+        with Live(console=console, refresh_per_second=8) as live:
+            for chunk in agent.stream_compose(
                 content_type=content_type,
                 topic=topic,
                 recipient=recipient,
                 tone=tone,
-            )
-
-        console.print("\n[bold green]✓[/bold green] Generated Content:\n")
-        console.print(Panel(content, title=f"{character}'s {content_type}", border_style="cyan"))
+            ):
+                content += chunk
+                live.update(Panel(content, title=title, border_style="cyan"))
 
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
@@ -134,6 +261,8 @@ def kb_search(
     ),
 ):
     """Search the knowledge base."""
+    from storage.vector_store import get_shared_knowledge_base
+
     console.print(
         Panel.fit(
             f"[bold blue]Knowledge Base Search[/bold blue]\n"
@@ -144,7 +273,7 @@ def kb_search(
     )
 
     try:
-        kb = VectorKnowledgeBase()
+        kb = get_shared_knowledge_base()
         results = kb.search(query=query, character_name=character, k=limit)
 
         if not results:
@@ -169,6 +298,8 @@ def kb_info(
     character: str = typer.Argument(..., help="Character name"),
 ):
     """Display all knowledge about a character."""
+    from storage.vector_store import get_shared_knowledge_base
+
     console.print(
         Panel.fit(
             f"[bold blue]Character Knowledge[/bold blue]\n"
@@ -178,9 +309,13 @@ def kb_info(
     )
 
     try:
-        kb = VectorKnowledgeBase()
+        kb = get_shared_knowledge_base()
         knowledge = kb.get_character_knowledge(character)
 
+        if knowledge is None:
+            console.print(f"\n[yellow]No knowledge found for character: {character}[/yellow]")
+            return
+
         console.print("\n")
         console.print(Panel(knowledge, title=f"Knowledge: {character}", border_style="blue"))
 
@@ -189,6 +324,23 @@ def kb_info(
         raise typer.Exit(1)
 
 
+@app.command()
+def kb_reindex():
+    """Rebuild the knowledge base index with the current settings."""
+    from storage.vector_store import get_shared_knowledge_base
+
+    try:
+        kb = get_shared_knowledge_base()
+        with console.status("[bold green]Rebuilding index..."):
+            count = kb.rebuild_index()
+
+        console.print(f"\n[bold green]✓[/bold green] Re-indexed {count} documents.")
+
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        raise typer.Exit(1)
+
+
 @app.command()
 def init():
     """Initialize the project (create .env from template)."""
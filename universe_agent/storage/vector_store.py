@@ -1,4 +1,10 @@
 """Vector store for character knowledge base."""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
 from typing import List, Optional, Dict, Any
 
 from langchain.text_splitter import RecursiveCharacterTextSplitter
@@ -8,6 +14,116 @@ from pydantic import BaseModel
 
 from config import config
 
+try:
+    import torch
+except ImportError:
+    torch = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# HNSW index settings applied when the Chroma collection is created: cosine
+# space to match the normalized sentence embeddings, with M/construction_ef
+# raised above the defaults so recall holds up as the KB grows
+_COLLECTION_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:construction_ef": 200,
+    "hnsw:M": 32,
+}
+
+# Maximum number of query embeddings kept in the per-store LRU cache
+QUERY_EMBEDDING_CACHE_SIZE = 1024
+
+# Inserted chunks accumulated before the store is flushed to disk; older
+# Chroma versions rewrite the whole collection on persist, so flushing after
+# every insert is quadratic over an ingest run
+PERSIST_BATCH = 1000
+
+_torch_configured = False
+
+
+def _configure_torch() -> None:
+    """Tune torch threading for the CPU encoder, once per process.
+
+    Torch defaults leave intra-op parallelism unconfigured on some builds;
+    pinning it to the core count keeps the MiniLM matmuls fully parallel.
+    Must run before the first forward pass — interop threads can't be changed
+    after parallel work has started.
+    """
+    global _torch_configured
+    if _torch_configured or torch is None:
+        return
+    try:
+        torch.set_num_threads(os.cpu_count() or 1)
+        torch.set_num_interop_threads(2)
+    except RuntimeError:
+        # Parallel work already started elsewhere; keep current settings
+        pass
+    _torch_configured = True
+
+
+def _pack_bits(vector: List[float]) -> "np.ndarray":
+    """Pack a vector's sign bits into a uint8 array.
+
+    One bit per dimension cuts a 384-dim fp32 vector from 1536 bytes to 48,
+    and Hamming distance between packed vectors approximates cosine order
+    well enough to preselect candidates for exact re-scoring.
+
+    Args:
+        vector: Embedding vector
+
+    Returns:
+        Packed sign bits, uint8
+    """
+    return np.packbits(np.asarray(vector, dtype=np.float32) > 0.0)
+
+
+def _mmr_select(
+    query_vec: List[float],
+    vectors: List[List[float]],
+    lambda_mult: float,
+    k: int,
+) -> List[int]:
+    """Pick k diverse candidate indices by maximal marginal relevance.
+
+    Trades off relevance to the query against redundancy with already
+    selected candidates. Fully vectorized over numpy, so the numeric work
+    runs in BLAS rather than Python bytecode.
+
+    Args:
+        query_vec: Query embedding
+        vectors: Candidate embeddings, one row per candidate
+        lambda_mult: Relevance/diversity trade-off in [0, 1]; 1 is pure
+            relevance
+        k: Number of indices to select
+
+    Returns:
+        Selected indices in pick order
+    """
+    candidates = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(candidates, axis=1)
+    norms[norms == 0.0] = 1.0
+    unit = candidates / norms[:, None]
+
+    query = np.asarray(query_vec, dtype=np.float32)
+    query_norm = float(np.linalg.norm(query))
+    relevance = unit @ (query / query_norm if query_norm else query)
+
+    selected = [int(np.argmax(relevance))]
+    remaining = [i for i in range(len(unit)) if i != selected[0]]
+
+    while remaining and len(selected) < k:
+        rest = np.asarray(remaining)
+        redundancy = (unit[rest] @ unit[selected].T).max(axis=1)
+        scores = lambda_mult * relevance[rest] - (1.0 - lambda_mult) * redundancy
+        best = int(rest[np.argmax(scores)])
+        selected.append(best)
+        remaining.remove(best)
+
+    return selected
+
 
 class CharacterKnowledge(BaseModel):
     """Character knowledge entry."""
@@ -18,6 +134,89 @@ class CharacterKnowledge(BaseModel):
     metadata: Dict[str, Any] = {}
 
 
+class PersistentEmbeddingCache:
+    """Content-hash keyed disk cache wrapped around an embeddings object.
+
+    Document chunks are keyed by a blake2b hash of their text and stored in a
+    small sqlite file next to the Chroma data. Re-ingesting content that was
+    already embedded — the same wiki article scraped twice, snippets shared
+    across characters — skips the encoder for every chunk already in the
+    cache; only misses hit the model. Query embedding is passed through
+    untouched (it has its own in-memory LRU).
+
+    The key mixes in a namespace describing the encoder configuration, so
+    vectors computed under one setting (e.g. a different backend) are never
+    served after the setting changes — a kb-reindex under the new setting
+    re-embeds instead of replaying the old cache.
+    """
+
+    # sqlite limits bound parameters per statement; look hashes up in groups
+    LOOKUP_BATCH = 500
+
+    def __init__(self, base, cache_path, namespace: str = ""):
+        """Wrap an embeddings object with a disk cache.
+
+        Args:
+            base: The underlying embeddings implementation
+            cache_path: Path of the sqlite cache file
+            namespace: Encoder-configuration tag mixed into every key
+        """
+        self.base = base
+        self._namespace = namespace.encode("utf-8")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(cache_path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _key(self, text: str) -> bytes:
+        """Hash chunk text into a fixed-size, namespace-qualified cache key."""
+        return hashlib.blake2b(
+            text.encode("utf-8"), digest_size=16, key=self._namespace
+        ).digest()
+
+    def _lookup(self, keys: List[bytes]) -> Dict[bytes, List[float]]:
+        """Fetch cached vectors for the given keys."""
+        found: Dict[bytes, List[float]] = {}
+        with self._lock:
+            for start in range(0, len(keys), self.LOOKUP_BATCH):
+                batch = keys[start : start + self.LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                for key, vector in rows:
+                    found[key] = json.loads(vector)
+        return found
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [self._key(text) for text in texts]
+        found = self._lookup(keys)
+        vectors: List[Optional[List[float]]] = [found.get(key) for key in keys]
+
+        miss_indices = [i for i, vector in enumerate(vectors) if vector is None]
+        if miss_indices:
+            computed = self.base.embed_documents([texts[i] for i in miss_indices])
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings VALUES (?, ?)",
+                    [
+                        (keys[i], json.dumps(vector))
+                        for i, vector in zip(miss_indices, computed)
+                    ],
+                )
+                self._conn.commit()
+            for i, vector in zip(miss_indices, computed):
+                vectors[i] = vector
+
+        return vectors
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.base.embed_query(text)
+
+
 class VectorKnowledgeBase:
     """Vector store-based knowledge base for characters."""
 
@@ -30,11 +229,45 @@ class VectorKnowledgeBase:
         self.collection_name = collection_name or config.vector_store.collection_name
         self.persist_directory = str(config.vector_store.chroma_persist_dir)
 
-        # Use HuggingFace embeddings (free, runs locally)
+        # Use HuggingFace embeddings (free, runs locally). sentence-transformers
+        # length-sorts inputs internally before batching, so splitter chunks of
+        # very different sizes don't waste padding compute; the batch size just
+        # needs to be large enough for that sorting to pay off on bulk ingest.
+        # EMBEDDING_BACKEND=onnx runs the encoder through ONNX Runtime
+        # (requires sentence-transformers[onnx]) for faster CPU inference.
+        _configure_torch()
+        model_kwargs = {}
+        if config.vector_store.embedding_backend != "torch":
+            model_kwargs["backend"] = config.vector_store.embedding_backend
         self.embeddings = HuggingFaceEmbeddings(
-            model_name="sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+            model_name="sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2",
+            model_kwargs=model_kwargs,
+            encode_kwargs={"batch_size": 64},
+        )
+
+        # fp16 halves memory bandwidth on GPU; on CPU it's slower, so skip
+        if (
+            torch is not None
+            and torch.cuda.is_available()
+            and config.vector_store.embedding_backend == "torch"
+        ):
+            self.embeddings.client.half()
+
+        # Reuse previously computed chunk embeddings across sessions; keyed
+        # by the backend so a setting change invalidates old vectors
+        self.embeddings = PersistentEmbeddingCache(
+            self.embeddings,
+            config.vector_store.chroma_persist_dir / "embedding_cache.sqlite3",
+            namespace=config.vector_store.embedding_backend,
         )
 
+        # The HuggingFaceEmbeddings constructor above already loaded the
+        # model weights synchronously; what's left is the first-encode cost
+        # (tokenizer init, kernel/graph warm-up). Pay it off-thread during
+        # the rest of agent bootstrap instead of on the first real query.
+        self._warmup_thread = threading.Thread(target=self._warmup, daemon=True)
+        self._warmup_thread.start()
+
         # Initialize text splitter
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=1000,
@@ -43,48 +276,243 @@ class VectorKnowledgeBase:
         )
 
         # Initialize or load vector store
-        self.vectorstore = Chroma(
+        self.vectorstore = self._create_vectorstore()
+
+        # Memoized get_character_knowledge results; cleared on writes
+        self._knowledge_cache: Dict[Any, Optional[str]] = {}
+
+        # Chunks inserted since the last flush; see _maybe_persist
+        self._pending_writes = 0
+        self.persist_batch = PERSIST_BATCH
+
+        # LRU cache of query embeddings; repeated queries (e.g. character
+        # names) skip the transformer forward pass entirely
+        self._query_embedding_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+
+    def _warmup(self) -> None:
+        """Run one throwaway query so first-encode setup happens off-thread.
+
+        Best-effort: a failure is swallowed here and surfaces on the first
+        real use instead.
+        """
+        try:
+            self.embeddings.embed_query("warmup")
+        except Exception:
+            pass
+
+    def _wait_for_warmup(self) -> None:
+        """Block until the background model load has finished.
+
+        Called before every encoder use, so real work never races the
+        warm-up forward pass; once the thread has finished this is a cheap
+        liveness check.
+        """
+        if self._warmup_thread.is_alive():
+            self._warmup_thread.join()
+
+    def _create_vectorstore(self) -> Chroma:
+        """Create or load the Chroma collection with the ANN index settings.
+
+        Returns:
+            Chroma vector store instance
+        """
+        return Chroma(
             collection_name=self.collection_name,
             embedding_function=self.embeddings,
             persist_directory=self.persist_directory,
+            collection_metadata=_COLLECTION_METADATA,
         )
 
+    def rebuild_index(self) -> int:
+        """Recreate the collection so the current index settings take effect.
+
+        HNSW parameters only apply at collection creation, so collections
+        created before a settings change keep their old index until rebuilt.
+
+        Returns:
+            Number of documents re-indexed
+        """
+        self._wait_for_warmup()
+
+        existing = self.vectorstore.get(include=["documents", "metadatas"])
+        documents = existing.get("documents") or []
+        metadatas = existing.get("metadatas") or []
+
+        self.vectorstore.delete_collection()
+        self.vectorstore = self._create_vectorstore()
+        self._knowledge_cache.clear()
+
+        if documents:
+            self.vectorstore.add_texts(texts=documents, metadatas=metadatas)
+
+        return len(documents)
+
+    @staticmethod
+    def _chunk_metadata(knowledge: CharacterKnowledge) -> Dict[str, Any]:
+        """Build the metadata dict shared by all chunks of an entry."""
+        return {
+            "character_name": knowledge.character_name,
+            "source": knowledge.source,
+            **knowledge.metadata,
+        }
+
     def add_knowledge(self, knowledge: CharacterKnowledge) -> None:
         """Add character knowledge to the vector store.
 
         Args:
             knowledge: CharacterKnowledge object to add
         """
+        self._wait_for_warmup()
+
         # Split content into chunks
         chunks = self.text_splitter.split_text(knowledge.content)
 
-        # Prepare metadata for each chunk
-        metadatas = [
-            {
-                "character_name": knowledge.character_name,
-                "source": knowledge.source,
-                **knowledge.metadata,
-            }
-            for _ in chunks
-        ]
+        # Every chunk of an entry carries identical metadata; merge the dict
+        # once and hand each chunk a shallow copy instead of re-merging
+        metadata = self._chunk_metadata(knowledge)
+        metadatas = [metadata.copy() for _ in chunks]
+        self._attach_bit_signatures(chunks, metadatas)
 
         # Add to vector store
         self.vectorstore.add_texts(texts=chunks, metadatas=metadatas)
+        self._knowledge_cache.clear()
+        self._maybe_persist(len(chunks))
 
     def add_knowledge_batch(self, knowledge_list: List[CharacterKnowledge]) -> None:
-        """Add multiple knowledge entries at once.
+        """Add multiple knowledge entries in one batched insert.
+
+        All chunks from all entries are collected first, so the embedding
+        model encodes them as a single batch and Chroma performs one bulk
+        insert instead of one transaction per entry.
 
         Args:
             knowledge_list: List of CharacterKnowledge objects
         """
+        self._wait_for_warmup()
+
+        chunks: List[str] = []
+        metadatas: List[Dict[str, Any]] = []
+
         for knowledge in knowledge_list:
-            self.add_knowledge(knowledge)
+            entry_chunks = self.text_splitter.split_text(knowledge.content)
+            chunks.extend(entry_chunks)
+            metadata = self._chunk_metadata(knowledge)
+            metadatas.extend(metadata.copy() for _ in entry_chunks)
+
+        if chunks:
+            self._attach_bit_signatures(chunks, metadatas)
+            self.vectorstore.add_texts(texts=chunks, metadatas=metadatas)
+            self._knowledge_cache.clear()
+            self._maybe_persist(len(chunks))
+
+    def _attach_bit_signatures(
+        self, chunks: List[str], metadatas: List[Dict[str, Any]]
+    ) -> None:
+        """Store each chunk's packed sign bits in its metadata.
+
+        The sidecar lets search_binary prefilter candidates with Hamming
+        distance instead of full cosine math. The embedding pass here is
+        answered back to add_texts from the persistent cache, so chunks are
+        still encoded only once.
+
+        Args:
+            chunks: Chunk texts about to be inserted
+            metadatas: Their metadata dicts, mutated in place
+        """
+        if np is None:
+            return
+        vectors = self.embeddings.embed_documents(chunks)
+        for metadata, vector in zip(metadatas, vectors):
+            metadata["bits_hex"] = _pack_bits(vector).tobytes().hex()
+
+    def search_binary(
+        self,
+        query: str,
+        character_name: Optional[str] = None,
+        k: int = 5,
+        rerank_multiplier: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """Search with a binary prefilter and exact cosine re-scoring.
+
+        Candidates are first ranked by Hamming distance between packed sign
+        bits — XOR plus popcount over 48-byte signatures instead of fp32
+        dot products over full vectors — then the best rerank_multiplier*k
+        survivors are re-scored with true cosine against their stored
+        embeddings. Falls back to :meth:`search` when numpy is unavailable
+        or no chunk carries a bit signature yet.
+
+        Args:
+            query: Search query
+            character_name: Filter by character name (optional)
+            k: Number of results to return
+            rerank_multiplier: Over-fetch factor for the exact re-score
+
+        Returns:
+            List of relevant documents with metadata
+        """
+        if np is None:
+            return self.search(query, character_name=character_name, k=k)
+
+        filter_dict = {"character_name": character_name} if character_name else None
+        query_vector = self._embed_query_cached(query)
+
+        existing = self.vectorstore.get(where=filter_dict, include=["metadatas"])
+        ids = existing.get("ids") or []
+        metadatas = existing.get("metadatas") or []
+
+        signed_ids = []
+        signatures = []
+        for doc_id, metadata in zip(ids, metadatas):
+            bits_hex = (metadata or {}).get("bits_hex")
+            if bits_hex:
+                signed_ids.append(doc_id)
+                signatures.append(np.frombuffer(bytes.fromhex(bits_hex), dtype=np.uint8))
+
+        if not signatures:
+            return self.search(query, character_name=character_name, k=k)
+
+        # Hamming distance to the query signature, vectorized across all rows
+        query_bits = _pack_bits(query_vector)
+        xor = np.bitwise_xor(np.stack(signatures), query_bits)
+        hamming = np.unpackbits(xor, axis=1).sum(axis=1)
+        shortlist = np.argsort(hamming)[: max(rerank_multiplier * k, k)]
+
+        # Exact cosine over the shortlist only
+        survivors = self.vectorstore.get(
+            ids=[signed_ids[i] for i in shortlist],
+            include=["documents", "metadatas", "embeddings"],
+        )
+        documents = survivors.get("documents") or []
+        metadatas = survivors.get("metadatas") or []
+        vectors = np.asarray(survivors.get("embeddings"), dtype=np.float32)
+
+        if len(documents) == 0:
+            return []
+
+        norms = np.linalg.norm(vectors, axis=1)
+        norms[norms == 0.0] = 1.0
+        query_arr = np.asarray(query_vector, dtype=np.float32)
+        query_norm = float(np.linalg.norm(query_arr))
+        similarities = (vectors / norms[:, None]) @ (
+            query_arr / query_norm if query_norm else query_arr
+        )
+
+        return [
+            {
+                "content": documents[i],
+                "metadata": metadatas[i] or {},
+                "relevance_score": float(similarities[i]),
+            }
+            for i in np.argsort(similarities)[::-1][:k]
+        ]
 
     def search(
         self,
         query: str,
         character_name: Optional[str] = None,
         k: int = 5,
+        diversify: bool = False,
+        lambda_mult: float = 0.5,
     ) -> List[Dict[str, Any]]:
         """Search the knowledge base.
 
@@ -92,16 +520,23 @@ class VectorKnowledgeBase:
             query: Search query
             character_name: Filter by character name (optional)
             k: Number of results to return
+            diversify: Re-rank an over-fetched candidate set with maximal
+                marginal relevance, trading a little relevance for coverage
+            lambda_mult: Relevance/diversity trade-off for diversify
 
         Returns:
             List of relevant documents with metadata
         """
         # Build filter if character_name is provided
         filter_dict = {"character_name": character_name} if character_name else None
+        query_vector = self._embed_query_cached(query)
+
+        if diversify and np is not None:
+            return self._search_diverse(query_vector, filter_dict, k, lambda_mult)
 
-        # Search
-        results = self.vectorstore.similarity_search_with_score(
-            query,
+        # Search by vector so repeated queries reuse the cached embedding
+        results = self.vectorstore.similarity_search_by_vector_with_relevance_scores(
+            query_vector,
             k=k,
             filter=filter_dict,
         )
@@ -119,46 +554,213 @@ class VectorKnowledgeBase:
 
         return formatted_results
 
-    def get_character_knowledge(self, character_name: str, max_results: int = 20) -> str:
+    def _search_diverse(
+        self,
+        query_vector: List[float],
+        filter_dict: Optional[Dict[str, Any]],
+        k: int,
+        lambda_mult: float,
+    ) -> List[Dict[str, Any]]:
+        """Over-fetch candidates and re-rank them with MMR.
+
+        Queries the underlying collection directly so candidate embeddings
+        come back with the documents; the numpy re-rank then picks k results
+        that cover the query instead of k near-duplicates.
+
+        Args:
+            query_vector: Embedded query
+            filter_dict: Optional metadata filter
+            k: Number of results to return
+            lambda_mult: Relevance/diversity trade-off
+
+        Returns:
+            List of relevant documents with metadata
+        """
+        raw = self.vectorstore._collection.query(
+            query_embeddings=[query_vector],
+            n_results=max(4 * k, 20),
+            where=filter_dict,
+            include=["documents", "metadatas", "distances", "embeddings"],
+        )
+        documents = (raw.get("documents") or [[]])[0]
+        metadatas = (raw.get("metadatas") or [[]])[0]
+        distances = (raw.get("distances") or [[]])[0]
+        embeddings = (raw.get("embeddings") or [[]])[0]
+
+        if len(documents) == 0:
+            return []
+
+        return [
+            {
+                "content": documents[i],
+                "metadata": metadatas[i] or {},
+                "relevance_score": float(distances[i]),
+            }
+            for i in _mmr_select(query_vector, embeddings, lambda_mult, k)
+        ]
+
+    def _embed_query_cached(self, query: str) -> List[float]:
+        """Embed a query string, reusing cached vectors for repeats.
+
+        Args:
+            query: Query text to embed
+
+        Returns:
+            Embedding vector for the query
+        """
+        cached = self._query_embedding_cache.get(query)
+        if cached is not None:
+            self._query_embedding_cache.move_to_end(query)
+            return cached
+
+        self._wait_for_warmup()
+        vector = self.embeddings.embed_query(query)
+        self._query_embedding_cache[query] = vector
+        if len(self._query_embedding_cache) > QUERY_EMBEDDING_CACHE_SIZE:
+            self._query_embedding_cache.popitem(last=False)
+        return vector
+
+    def list_character_chunks(
+        self, character_name: str, limit: int = 20
+    ) -> List[Dict[str, Any]]:
+        """List stored chunks for a character without a similarity search.
+
+        Uses Chroma's metadata-filtered get, which reads straight from the
+        collection — no query embedding, no ANN traversal, no scoring.
+
+        Args:
+            character_name: Name of the character
+            limit: Maximum number of chunks to return
+
+        Returns:
+            List of chunks with their metadata
+        """
+        existing = self.vectorstore.get(
+            where={"character_name": character_name},
+            limit=limit,
+            include=["documents", "metadatas"],
+        )
+        documents = existing.get("documents") or []
+        metadatas = existing.get("metadatas") or []
+
+        return [
+            {"content": document, "metadata": metadata or {}}
+            for document, metadata in zip(documents, metadatas)
+        ]
+
+    def get_character_knowledge(
+        self, character_name: str, max_results: int = 20
+    ) -> Optional[str]:
         """Get all knowledge about a character as formatted text.
 
+        Results are memoized per instance (the KB rarely changes within a
+        session); any write to the store clears the memo.
+
         Args:
             character_name: Name of the character
             max_results: Maximum number of knowledge chunks to return
 
         Returns:
-            Formatted string with character knowledge
+            Formatted string with character knowledge, or None if the
+            knowledge base has nothing for this character
         """
-        results = self.search(
-            query=character_name,
-            character_name=character_name,
-            k=max_results,
-        )
+        cache_key = (character_name, max_results)
+        if cache_key in self._knowledge_cache:
+            return self._knowledge_cache[cache_key]
+
+        # "Everything about X" is a metadata lookup, not a similarity query;
+        # fetching by filter skips embedding the character name entirely
+        results = self.list_character_chunks(character_name, limit=max_results)
 
         if not results:
-            return f"No knowledge found for character: {character_name}"
+            formatted = None
+        else:
+            output = [f"Knowledge about {character_name}:\n"]
 
-        output = [f"Knowledge about {character_name}:\n"]
+            for i, result in enumerate(results, 1):
+                source = result["metadata"].get("source", "unknown")
+                output.append(f"{i}. [Source: {source}]")
+                output.append(result["content"])
+                output.append("")
 
-        for i, result in enumerate(results, 1):
-            source = result["metadata"].get("source", "unknown")
-            output.append(f"{i}. [Source: {source}]")
-            output.append(result["content"])
-            output.append("")
+            formatted = "\n".join(output)
 
-        return "\n".join(output)
+        self._knowledge_cache[cache_key] = formatted
+        return formatted
 
     def delete_character(self, character_name: str) -> None:
         """Delete all knowledge about a character.
 
+        Deletes by metadata filter directly on the underlying collection,
+        which removes the matching documents in place — no collection
+        rebuild. Older Chroma versions without filter-based deletion fall
+        back to resolving the matching ids first and deleting those.
+
         Args:
             character_name: Name of the character to delete
         """
-        # Note: Chroma doesn't have direct filter-based deletion in all versions
-        # This is a simplified version
-        print(f"Deleting knowledge for: {character_name}")
-        print("Note: Full deletion requires recreating the collection")
+        where = {"character_name": character_name}
+        collection = self.vectorstore._collection
+        try:
+            collection.delete(where=where)
+        except (TypeError, ValueError):
+            existing = collection.get(where=where, include=[])
+            ids = existing.get("ids") or []
+            if ids:
+                collection.delete(ids=ids)
+
+        self._knowledge_cache.clear()
+
+    def refresh_character(
+        self, character_name: str, knowledge_list: List[CharacterKnowledge]
+    ) -> None:
+        """Replace a character's knowledge with a fresh set of entries.
+
+        Args:
+            character_name: Name of the character to replace
+            knowledge_list: New knowledge entries for the character
+        """
+        self.delete_character(character_name)
+        self.add_knowledge_batch(knowledge_list)
+
+    def _maybe_persist(self, written: int) -> None:
+        """Count freshly inserted chunks and flush once a batch accumulates.
+
+        Flushing after every insert makes ingest O(N^2) on Chroma versions
+        that rewrite the collection per persist; batching amortizes that to
+        one flush per persist_batch chunks. Newer chromadb builds persist
+        automatically, in which case the explicit flush is a cheap no-op.
+
+        Args:
+            written: Number of chunks just inserted
+        """
+        self._pending_writes += written
+        if self._pending_writes >= self.persist_batch:
+            self.persist()
 
     def persist(self) -> None:
-        """Persist the vector store to disk."""
+        """Persist the vector store to disk and reset the pending counter."""
+        self._pending_writes = 0
         self.vectorstore.persist()
+
+
+_shared_kb: Optional[VectorKnowledgeBase] = None
+_shared_kb_lock = threading.Lock()
+
+
+def get_shared_knowledge_base() -> VectorKnowledgeBase:
+    """Return the process-wide knowledge base for the default collection.
+
+    Constructing a VectorKnowledgeBase loads the embedding model, which is by
+    far the most expensive part of agent startup; sharing one instance means
+    the model is loaded once per process, and a background warm-up (e.g. at
+    CLI start) benefits every later consumer.
+
+    Returns:
+        Shared VectorKnowledgeBase instance
+    """
+    global _shared_kb
+    with _shared_kb_lock:
+        if _shared_kb is None:
+            _shared_kb = VectorKnowledgeBase()
+        return _shared_kb
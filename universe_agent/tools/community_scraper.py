@@ -1,12 +1,24 @@
 """Community and fan site scraping utilities."""
-from typing import List, Optional
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Tuple
 from urllib.parse import quote
 
 from langchain.tools import Tool
 from pydantic import BaseModel
 
+from config import config
 from tools.web_scraper import WebScraper
 
+# Wiki articles change rarely; cache parsed posts for a day. A miss (no page
+# exists for the query) is cached too, but shorter, so a page created later
+# is picked up within the hour.
+POST_TTL = 86400
+NEGATIVE_TTL = 3600
+
 
 class CommunityPost(BaseModel):
     """Community post data."""
@@ -17,12 +29,79 @@ class CommunityPost(BaseModel):
     source: str  # e.g., "namu.wiki", "reddit", etc.
 
 
+class CommunityPostCache:
+    """TTL'd disk cache of parsed community posts.
+
+    A hit skips both the network fetch and the HTML parse. Entries are keyed
+    by source-qualified query and stored as JSON rows in a small sqlite file
+    under the cache directory; expired rows simply read as misses.
+    """
+
+    def __init__(self, cache_path):
+        """Open (or create) the cache file.
+
+        Args:
+            cache_path: Path of the sqlite cache file
+        """
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(cache_path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS posts "
+            "(key TEXT PRIMARY KEY, payload TEXT, expires REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Tuple[Optional[CommunityPost], bool]:
+        """Look up a cached post.
+
+        Args:
+            key: Source-qualified query key
+
+        Returns:
+            (post, hit) pair; post is None on a cached negative result
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, expires FROM posts WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None or row[1] < time.time():
+            return None, False
+
+        payload = row[0]
+        post = CommunityPost(**json.loads(payload)) if payload else None
+        return post, True
+
+    def put(self, key: str, post: Optional[CommunityPost], ttl: float) -> None:
+        """Store a post (or a negative result) with an expiry.
+
+        Args:
+            key: Source-qualified query key
+            post: Parsed post, or None to record that nothing was found
+            ttl: Lifetime of the entry in seconds
+        """
+        payload = post.model_dump_json() if post else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO posts VALUES (?, ?, ?)",
+                (key, payload, time.time() + ttl),
+            )
+            self._conn.commit()
+
+
 class CommunityScraper:
     """Scraper for various community sites and fan communities."""
 
     def __init__(self):
         self.scraper = WebScraper()
 
+        # Source registry: each entry takes a query and returns a post or
+        # None. New sources (reddit, fandom wikis, ...) just register here
+        # and are searched concurrently with the rest.
+        self._sources = [self.search_namuwiki]
+
+        self._cache = CommunityPostCache(config.cache_dir / "community_posts.sqlite3")
+
     def search_namuwiki(self, query: str) -> Optional[CommunityPost]:
         """Search and scrape from Namu Wiki (Korean community wiki).
 
@@ -32,6 +111,11 @@ class CommunityScraper:
         Returns:
             CommunityPost with wiki content or None
         """
+        cache_key = f"namu.wiki:{query}"
+        cached, hit = self._cache.get(cache_key)
+        if hit:
+            return cached
+
         encoded_query = quote(query)
         url = f"https://namu.wiki/w/{encoded_query}"
 
@@ -39,18 +123,43 @@ class CommunityScraper:
             page = self.scraper.scrape(url)
 
             if "존재하지 않는" in page.content or "error" in page.metadata:
+                # Cache "no such page" briefly; transient scrape errors
+                # (metadata["error"]) are not cached at all
+                if "error" not in page.metadata:
+                    self._cache.put(cache_key, None, NEGATIVE_TTL)
                 return None
 
-            return CommunityPost(
+            post = CommunityPost(
                 title=page.title or query,
                 url=url,
                 content=page.content[:3000],  # Limit content length
                 source="namu.wiki",
             )
+            self._cache.put(cache_key, post, POST_TTL)
+            return post
         except Exception as e:
             print(f"Namu Wiki scraping error: {e}")
             return None
 
+    async def _search_all_sources(self, query: str) -> List[CommunityPost]:
+        """Query every registered source concurrently and collect the hits.
+
+        Sources overlap at network RTT, so total latency is the slowest
+        source rather than the sum; a source that raises just drops out of
+        the results.
+
+        Args:
+            query: The search term
+
+        Returns:
+            Posts from the sources that found something
+        """
+        gathered = await asyncio.gather(
+            *[asyncio.to_thread(source, query) for source in self._sources],
+            return_exceptions=True,
+        )
+        return [post for post in gathered if isinstance(post, CommunityPost)]
+
     def search_communities(self, query: str) -> str:
         """Search multiple community sources for information.
 
@@ -60,12 +169,7 @@ class CommunityScraper:
         Returns:
             Formatted string with community information
         """
-        results = []
-
-        # Try Namu Wiki
-        namu_result = self.search_namuwiki(query)
-        if namu_result:
-            results.append(namu_result)
+        results = asyncio.run(self._search_all_sources(query))
 
         if not results:
             return f"No community information found for: {query}"
@@ -88,6 +192,10 @@ def create_community_search_tool() -> Tool:
     """Create a LangChain tool for community searching."""
     scraper = CommunityScraper()
 
+    async def asearch_communities(query: str) -> str:
+        """Async wrapper so concurrent tool calls don't block the event loop."""
+        return await asyncio.to_thread(scraper.search_communities, query)
+
     return Tool(
         name="community_search",
         description=(
@@ -98,4 +206,5 @@ def create_community_search_tool() -> Tool:
             "and fan-created content."
         ),
         func=scraper.search_communities,
+        coroutine=asearch_communities,
     )
@@ -1,4 +1,5 @@
 """Google search utilities."""
+import asyncio
 from typing import List, Optional
 
 from langchain.tools import Tool
@@ -88,6 +89,10 @@ def create_google_search_tool() -> Tool:
     """Create a LangChain tool for Google search."""
     searcher = GoogleSearcher()
 
+    async def asearch_with_snippets(query: str) -> str:
+        """Async wrapper so concurrent tool calls don't block the event loop."""
+        return await asyncio.to_thread(searcher.search_with_snippets, query)
+
     return Tool(
         name="google_search",
         description=(
@@ -96,4 +101,5 @@ def create_google_search_tool() -> Tool:
             "news, and general web content about characters, web novels, or entertainment sources."
         ),
         func=searcher.search_with_snippets,
+        coroutine=asearch_with_snippets,
     )
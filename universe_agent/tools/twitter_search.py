@@ -1,4 +1,5 @@
 """Twitter/X search utilities."""
+import asyncio
 from typing import List, Optional
 from datetime import datetime
 
@@ -13,6 +14,11 @@ try:
 except ImportError:
     TWEEPY_AVAILABLE = False
 
+# Field selections sent with every search; built once instead of per call
+_TWEET_FIELDS = ("created_at", "public_metrics", "author_id")
+_USER_FIELDS = ("username",)
+_EXPANSIONS = ("author_id",)
+
 
 class Tweet(BaseModel):
     """Tweet data."""
@@ -67,23 +73,25 @@ class TwitterSearcher:
             response = self.client.search_recent_tweets(
                 query=f"{query} lang:{language}",
                 max_results=min(max_results, 100),
-                tweet_fields=["created_at", "public_metrics", "author_id"],
-                user_fields=["username"],
-                expansions=["author_id"],
+                tweet_fields=_TWEET_FIELDS,
+                user_fields=_USER_FIELDS,
+                expansions=_EXPANSIONS,
             )
 
             if not response.data:
                 return tweets
 
-            # Create user lookup
-            users = {user.id: user.username for user in response.includes.get("users", [])}
+            # Create user lookup; includes is absent when no expansion matched
+            includes = response.includes or {}
+            users = {user.id: user.username for user in includes.get("users", [])}
 
             for tweet in response.data:
                 metrics = tweet.public_metrics or {}
                 author = users.get(tweet.author_id, "unknown")
 
+                # Fields come straight off the API objects; skip re-validation
                 tweets.append(
-                    Tweet(
+                    Tweet.model_construct(
                         id=str(tweet.id),
                         text=tweet.text,
                         author=author,
@@ -136,6 +144,10 @@ def create_twitter_search_tool() -> Tool:
     """Create a LangChain tool for Twitter search."""
     searcher = TwitterSearcher()
 
+    async def asearch_formatted(query: str) -> str:
+        """Async wrapper so concurrent tool calls don't block the event loop."""
+        return await asyncio.to_thread(searcher.search_formatted, query)
+
     return Tool(
         name="twitter_search",
         description=(
@@ -144,4 +156,5 @@ def create_twitter_search_tool() -> Tool:
             "trending discussions, and community sentiment about characters or content."
         ),
         func=searcher.search_formatted,
+        coroutine=asearch_formatted,
     )
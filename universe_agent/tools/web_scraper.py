@@ -1,15 +1,47 @@
 """Web scraping utilities."""
+import asyncio
+import re
+import threading
 import time
-from typing import Optional
+from typing import Dict, List, Optional
 from urllib.parse import urljoin, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 from langchain.tools import Tool
 from pydantic import BaseModel, Field
 
 from config import config
 
+# lxml parses medium pages several times faster than the pure-Python parser;
+# fall back gracefully where it isn't installed
+try:
+    import lxml  # noqa: F401
+
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+# At most this much of a page body is downloaded; consumers truncate the
+# extracted text to a few KB anyway, so multi-MB pages are wasted bytes
+MAX_PAGE_BYTES = 512 * 1024
+
+# CSS selectors tried in order when locating the main content block; all are
+# plain CSS, so one select_one path serves every entry (soupsieve caches the
+# compiled selector after the first page)
+_CONTENT_SELECTORS = (
+    "article",
+    "main",
+    "div[class*='content']",
+    "div[class*='post']",
+)
+
+# Collapses blank lines and surrounding indentation in one C-level pass,
+# replacing a per-line strip/filter loop over the extracted text
+_WS_RE = re.compile(r"[ \t]*\n[ \t\n]*")
+
 
 class WebPage(BaseModel):
     """Scraped web page data."""
@@ -25,7 +57,44 @@ class WebScraper:
 
     def __init__(self):
         self.session = requests.Session()
-        self.session.headers.update({"User-Agent": config.search.user_agent})
+        self.session.headers.update(
+            {
+                "User-Agent": config.search.user_agent,
+                "Accept-Encoding": "gzip, deflate",
+            }
+        )
+
+        # Larger keep-alive pool so concurrent fetches against the same hosts
+        # reuse sockets instead of re-handshaking TLS; transient upstream
+        # errors get a couple of backed-off retries
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Politeness delay is tracked per host, so fetches against different
+        # hosts don't serialize each other
+        self._host_last_request: Dict[str, float] = {}
+        self._host_lock = threading.Lock()
+
+    def _throttle(self, host: str) -> None:
+        """Wait out the remaining politeness delay for a host, if any."""
+        delay = config.search.scraping_delay
+        with self._host_lock:
+            last = self._host_last_request.get(host)
+            now = time.monotonic()
+            wait = 0.0 if last is None else delay - (now - last)
+            # Reserve the slot before sleeping so concurrent callers queue up
+            self._host_last_request[host] = now + max(wait, 0.0)
+        if wait > 0:
+            time.sleep(wait)
 
     def scrape(self, url: str) -> WebPage:
         """Scrape content from a URL.
@@ -37,11 +106,27 @@ class WebScraper:
             WebPage object with extracted content
         """
         try:
-            time.sleep(config.search.scraping_delay)
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, "html.parser")
+            self._throttle(urlparse(url).netloc)
+            response = self.session.get(url, timeout=10, stream=True)
+            try:
+                response.raise_for_status()
+
+                # Don't download bodies the parser can't use
+                content_type = response.headers.get("Content-Type", "")
+                if content_type and "html" not in content_type.lower():
+                    return WebPage.model_construct(
+                        url=url,
+                        title=None,
+                        content=f"Skipped non-HTML content: {content_type}",
+                        metadata={"content_type": content_type},
+                    )
+
+                # Read at most MAX_PAGE_BYTES; urllib3 handles gzip/deflate
+                body = response.raw.read(MAX_PAGE_BYTES, decode_content=True)
+            finally:
+                response.close()
+
+            soup = BeautifulSoup(body, _HTML_PARSER)
 
             # Remove script and style elements
             for element in soup(["script", "style", "nav", "footer", "header"]):
@@ -50,20 +135,15 @@ class WebScraper:
             # Extract title
             title = None
             if soup.title:
-                title = soup.title.string
+                # Plain str, not a NavigableString that pins the parse tree
+                title = str(soup.title.string) if soup.title.string else None
             elif soup.find("h1"):
                 title = soup.find("h1").get_text(strip=True)
 
             # Extract main content
-            content_tags = ["article", "main", "div[class*='content']", "div[class*='post']"]
             content = None
-
-            for tag in content_tags:
-                if "class" in tag:
-                    element = soup.select_one(tag)
-                else:
-                    element = soup.find(tag)
-
+            for selector in _CONTENT_SELECTORS:
+                element = soup.select_one(selector)
                 if element:
                     content = element.get_text(separator="\n", strip=True)
                     break
@@ -73,8 +153,7 @@ class WebScraper:
                 content = soup.get_text(separator="\n", strip=True)
 
             # Clean up excessive whitespace
-            lines = [line.strip() for line in content.split("\n") if line.strip()]
-            content = "\n".join(lines)
+            content = _WS_RE.sub("\n", content).strip()
 
             # Extract metadata
             metadata = {
@@ -83,15 +162,53 @@ class WebScraper:
                 "keywords": self._extract_meta(soup, "keywords"),
             }
 
-            return WebPage(url=url, title=title, content=content, metadata=metadata)
+            # Every field is assembled locally, so validation has nothing to
+            # catch; model_construct skips it on this per-page hot path
+            return WebPage.model_construct(
+                url=url, title=title, content=content, metadata=metadata
+            )
 
         except Exception as e:
-            return WebPage(
+            return WebPage.model_construct(
                 url=url,
+                title=None,
                 content=f"Error scraping {url}: {str(e)}",
                 metadata={"error": str(e)},
             )
 
+    async def ascrape(self, url: str) -> WebPage:
+        """Async variant of :meth:`scrape`.
+
+        Args:
+            url: The URL to scrape
+
+        Returns:
+            WebPage object with extracted content
+        """
+        return await asyncio.to_thread(self.scrape, url)
+
+    async def scrape_many(self, urls: List[str], concurrency: int = 4) -> List[WebPage]:
+        """Scrape multiple URLs concurrently.
+
+        Fetches overlap up to the concurrency limit, so total wall time is
+        dominated by the slowest fetches instead of their sum; the per-host
+        politeness delay still applies within each host.
+
+        Args:
+            urls: URLs to scrape
+            concurrency: Maximum number of fetches in flight
+
+        Returns:
+            List of WebPage objects, in the same order as the input
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(url: str) -> WebPage:
+            async with semaphore:
+                return await self.ascrape(url)
+
+        return await asyncio.gather(*[_one(url) for url in urls])
+
     def _extract_meta(self, soup: BeautifulSoup, property_name: str) -> Optional[str]:
         """Extract meta tag content."""
         meta = soup.find("meta", attrs={"name": property_name}) or soup.find(
@@ -109,8 +226,13 @@ def create_web_scraper_tool() -> Tool:
         result = scraper.scrape(url)
         return f"Title: {result.title}\n\nContent:\n{result.content[:2000]}"
 
+    async def ascrape_wrapper(url: str) -> str:
+        """Async wrapper so concurrent tool calls don't block the event loop."""
+        return await asyncio.to_thread(scrape_wrapper, url)
+
     return Tool(
         name="web_scraper",
         description="Scrape content from a web page URL. Returns the page title and main content.",
         func=scrape_wrapper,
+        coroutine=ascrape_wrapper,
     )